@@ -19,3 +19,9 @@ DOUBLED_PAWN_PENALTY = -20
 ISOLATED_PAWN_PENALTY = -15
 MOBILITY_BONUS = 2
 TIME_LIMIT = 5  # seconds per move
+
+# Terminal scores
+MATE_SCORE = 100000
+MATE_THRESHOLD = MATE_SCORE - 1000  # scores beyond this are mates
+DRAW_SCORE = 0
+FIFTY_MOVE_LIMIT = 100  # halfmoves without a capture or pawn move
@@ -0,0 +1,80 @@
+import chess
+from .constants import FIFTY_MOVE_LIMIT
+
+
+class PositionHistory:
+    """Position key history for cheap repetition and fifty-move detection.
+
+    Keys are python-chess transposition keys, which are much cheaper to
+    build than a full polyglot Zobrist hash and are what python-chess uses
+    for its own repetition checks.
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.clocks = []
+        self.root_index = 0
+
+    def reset(self, board):
+        """Rebuild the history from the game that led to the board."""
+        replay = board.root()
+        self.keys = [replay._transposition_key()]
+        self.clocks = [replay.halfmove_clock]
+        for move in board.move_stack:
+            self._record(replay, move)
+        self.root_index = len(self.keys) - 1
+
+    @property
+    def ply(self):
+        """Number of moves played since the search root."""
+        return len(self.keys) - 1 - self.root_index
+
+    def push(self, board, move):
+        """Play a move on the board and record the resulting position."""
+        self._record(board, move)
+
+    def pop(self, board):
+        """Take back the last move on the board and its history entry."""
+        self.keys.pop()
+        self.clocks.pop()
+        return board.pop()
+
+    def is_fifty_moves(self, board):
+        """Check if the fifty-move rule can be claimed."""
+        # Checkmate on the hundredth halfmove still wins, rare enough to
+        # afford the full check here
+        return self.clocks[-1] >= FIFTY_MOVE_LIMIT and not board.is_checkmate()
+
+    def is_repetition(self):
+        """Check if the current position counts as a repetition.
+
+        Only positions since the last irreversible move are scanned. A
+        single repeat inside the search tree is enough, positions from the
+        game itself need to have occurred twice before.
+        """
+        key = self.keys[-1]
+        current = len(self.keys) - 1
+        earliest = max(0, current - self.clocks[-1])
+        count = 0
+        for i in range(current - 2, earliest - 1, -2):
+            if self.keys[i] == key:
+                if i >= self.root_index:
+                    return True
+                count += 1
+                if count >= 2:
+                    return True
+        return False
+
+    def is_draw(self, board):
+        """Check for draws that do not need move generation."""
+        return (
+            self.is_fifty_moves(board)
+            or self.is_repetition()
+            or board.is_insufficient_material()
+        )
+
+    def _record(self, board, move):
+        clock = 0 if board.is_zeroing(move) else self.clocks[-1] + 1
+        board.push(move)
+        self.keys.append(board._transposition_key())
+        self.clocks.append(clock)
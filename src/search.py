@@ -2,6 +2,8 @@ import chess
 import time
 from .move_ordering import MoveOrdering
 from .cache import TranspositionTable
+from .history import PositionHistory
+from .constants import MATE_SCORE, MATE_THRESHOLD, DRAW_SCORE
 
 
 class SearchAlgorithm:
@@ -26,12 +28,14 @@ class MinimaxSearch(SearchAlgorithm):
         self.MAX_QUIESCENCE_DEPTH = 5  # Limit quiescence search depth
         self.move_ordering = MoveOrdering()
         self.tt = TranspositionTable()
+        self.history = PositionHistory()
         self.LMR_THRESHOLD = 3  # depth threshold for late move reduction
         self.FULL_DEPTH_MOVES = 4  # number of moves to search at full depth
 
     def find_best_move(self, board):
         start_time = time.time()
         best_move = None
+        self.history.reset(board)
 
         # Iterative deepening
         for depth in range(1, self.max_depth + 1):
@@ -56,7 +60,7 @@ class MinimaxSearch(SearchAlgorithm):
         best_score = float("-inf") if board.turn == chess.WHITE else float("inf")
 
         for move in moves:
-            board.push(move)
+            self.history.push(board, move)
             # White maximizes, Black minimizes
             score = self._minimax(
                 board,
@@ -65,7 +69,7 @@ class MinimaxSearch(SearchAlgorithm):
                 float("inf"),
                 board.turn == chess.WHITE,
             )
-            board.pop()
+            self.history.pop(board)
 
             if board.turn == chess.WHITE:
                 if score > best_score:
@@ -79,25 +83,33 @@ class MinimaxSearch(SearchAlgorithm):
         return best_move
 
     def _minimax(self, board, depth, alpha, beta, maximizing_player):
+        # Draws are checked before the table, whose entries ignore history
+        if self.history.is_draw(board):
+            return DRAW_SCORE
+
         # Try transposition table lookup
         tt_entry = self.tt.lookup(board)
         if tt_entry and tt_entry["depth"] >= depth:
-            return tt_entry["score"]
+            return self._score_from_tt(tt_entry["score"])
 
-        if depth == 0 or board.is_game_over():
+        if depth == 0:
             return self._quiescence(
                 board, alpha, beta, maximizing_player, self.MAX_QUIESCENCE_DEPTH
             )
 
+        legal_moves = list(board.legal_moves)
+        if not legal_moves:
+            return self._terminal_score(board)
+
         best_move = None
         # Prioritize safe moves in search
-        moves = self.validator.get_safe_moves(board)
+        moves = self.validator.get_safe_moves(board, legal_moves) or legal_moves
         moves = MoveOrdering.sort_moves(board, moves)
 
         if maximizing_player:
             max_eval = float("-inf")
             for i, move in enumerate(moves):
-                board.push(move)
+                self.history.push(board, move)
 
                 # Late Move Reduction
                 if (
@@ -105,13 +117,13 @@ class MinimaxSearch(SearchAlgorithm):
                     and i >= self.FULL_DEPTH_MOVES
                     and not board.is_check()
                 ):
-                    eval = -self._minimax(board, depth - 2, -beta, -alpha, False)
+                    eval = self._minimax(board, depth - 2, alpha, beta, False)
                     if eval > alpha:  # Re-search if promising
-                        eval = -self._minimax(board, depth - 1, -beta, -alpha, False)
+                        eval = self._minimax(board, depth - 1, alpha, beta, False)
                 else:
-                    eval = -self._minimax(board, depth - 1, -beta, -alpha, False)
+                    eval = self._minimax(board, depth - 1, alpha, beta, False)
 
-                board.pop()
+                self.history.pop(board)
                 max_eval = max(max_eval, eval)
                 alpha = max(alpha, eval)
                 if eval > max_eval:
@@ -120,26 +132,56 @@ class MinimaxSearch(SearchAlgorithm):
                     break
 
             # Store position in transposition table
-            self.tt.store(board, depth, max_eval, "exact", best_move)
+            self.tt.store(
+                board, depth, self._score_to_tt(max_eval), "exact", best_move
+            )
             return max_eval
         else:
             min_eval = float("inf")
             for move in moves:
-                board.push(move)
+                self.history.push(board, move)
                 eval = self._minimax(board, depth - 1, alpha, beta, True)
-                board.pop()
+                self.history.pop(board)
                 min_eval = min(min_eval, eval)
                 beta = min(beta, eval)
                 if beta <= alpha:
                     break
             return min_eval
 
+    def _terminal_score(self, board):
+        """Score a position without legal moves, preferring shorter mates."""
+        if not board.is_check():
+            return DRAW_SCORE
+        score = MATE_SCORE - self.history.ply
+        return -score if board.turn == chess.WHITE else score
+
+    def _score_to_tt(self, score):
+        """Store mate scores as a distance from the node instead of the root."""
+        if score >= MATE_THRESHOLD:
+            return score + self.history.ply
+        if score <= -MATE_THRESHOLD:
+            return score - self.history.ply
+        return score
+
+    def _score_from_tt(self, score):
+        """Convert a stored mate score back to a distance from the root."""
+        if score >= MATE_THRESHOLD:
+            return score - self.history.ply
+        if score <= -MATE_THRESHOLD:
+            return score + self.history.ply
+        return score
+
     def _quiescence(self, board, alpha, beta, maximizing_player, depth):
         """Quiescence search to evaluate only capture moves."""
-        stand_pat = self.evaluator(board)
-
         if depth == 0:
-            return stand_pat
+            return self.evaluator(board)
+
+        # Mate and stalemate are checked before standing pat on the evaluation
+        legal_moves = list(board.legal_moves)
+        if not legal_moves:
+            return self._terminal_score(board)
+
+        stand_pat = self.evaluator(board)
 
         if maximizing_player:
             max_eval = stand_pat
@@ -153,7 +195,7 @@ class MinimaxSearch(SearchAlgorithm):
             beta = min(beta, min_eval)
 
         # Only look at capture moves
-        captures = [move for move in board.legal_moves if board.is_capture(move)]
+        captures = [move for move in legal_moves if board.is_capture(move)]
         ordered_captures = MoveOrdering.sort_moves(board, captures)
 
         if not captures:
@@ -161,9 +203,9 @@ class MinimaxSearch(SearchAlgorithm):
 
         if maximizing_player:
             for move in ordered_captures:
-                board.push(move)
+                self.history.push(board, move)
                 eval = self._quiescence(board, alpha, beta, False, depth - 1)
-                board.pop()
+                self.history.pop(board)
                 max_eval = max(max_eval, eval)
                 alpha = max(alpha, eval)
                 if beta <= alpha:
@@ -171,9 +213,9 @@ class MinimaxSearch(SearchAlgorithm):
             return max_eval
         else:
             for move in ordered_captures:
-                board.push(move)
+                self.history.push(board, move)
                 eval = self._quiescence(board, alpha, beta, True, depth - 1)
-                board.pop()
+                self.history.pop(board)
                 min_eval = min(min_eval, eval)
                 beta = min(beta, eval)
                 if beta <= alpha:
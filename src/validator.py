@@ -44,10 +44,16 @@ class MoveValidator:
         return not board.is_attacked_by(not color, square)
 
     @staticmethod
-    def get_safe_moves(board):
-        """Get moves that don't move pieces to attacked squares unless capturing."""
+    def get_safe_moves(board, moves=None):
+        """Get moves that don't move pieces to attacked squares unless capturing.
+
+        Already generated legal moves can be passed in to avoid generating
+        them again.
+        """
+        if moves is None:
+            moves = board.legal_moves
         safe_moves = []
-        for move in board.legal_moves:
+        for move in moves:
             # Always allow captures
             if board.is_capture(move):
                 safe_moves.append(move)
@@ -0,0 +1,59 @@
+import chess
+from src.history import PositionHistory
+
+
+def _play(board, history, ucis):
+    for uci in ucis:
+        history.push(board, chess.Move.from_uci(uci))
+
+
+def test_repetition_inside_search_is_draw():
+    board = chess.Board()
+    history = PositionHistory()
+    history.reset(board)
+    _play(board, history, ["g1f3", "g8f6", "f3g1", "f6g8"])
+    assert history.is_repetition()
+
+
+def test_single_repetition_from_game_is_not_draw():
+    board = chess.Board()
+    for uci in ["g1f3", "g8f6", "f3g1", "f6g8"]:
+        board.push_uci(uci)
+    history = PositionHistory()
+    history.reset(board)
+    assert not history.is_repetition()
+    _play(board, history, ["g1f3", "g8f6", "f3g1", "f6g8"])
+    assert history.is_repetition()
+
+
+def test_pop_restores_history():
+    board = chess.Board()
+    history = PositionHistory()
+    history.reset(board)
+    _play(board, history, ["g1f3", "g8f6", "f3g1", "f6g8"])
+    history.pop(board)
+    assert not history.is_repetition()
+    assert history.ply == 3
+    assert board.move_stack[-1] == chess.Move.from_uci("f3g1")
+
+
+def test_fifty_move_clock_resets_on_pawn_move_and_capture():
+    board = chess.Board()
+    history = PositionHistory()
+    history.reset(board)
+    _play(board, history, ["g1f3", "b8c6"])
+    assert history.clocks[-1] == 2
+    _play(board, history, ["e2e4"])
+    assert history.clocks[-1] == 0
+    _play(board, history, ["c6d4", "f3d4"])
+    assert history.clocks[-1] == 0
+    assert history.clocks == [0, 1, 2, 0, 1, 0]
+
+
+def test_fifty_move_rule_is_draw():
+    board = chess.Board("8/8/4k3/8/8/4K3/8/R7 w - - 99 80")
+    history = PositionHistory()
+    history.reset(board)
+    assert not history.is_draw(board)
+    _play(board, history, ["a1a2"])
+    assert history.is_draw(board)
@@ -0,0 +1,42 @@
+import chess
+from src.constants import MATE_SCORE
+from src.evaluator import Evaluator
+from src.pieces import PieceSquareTables
+from src.search import MinimaxSearch
+from src.validator import MoveValidator
+
+
+def _search(board):
+    search = MinimaxSearch(
+        Evaluator(PieceSquareTables()).evaluate, MoveValidator(), max_depth=2
+    )
+    search.history.reset(board)
+    return search
+
+
+def test_terminal_score_is_from_white_point_of_view():
+    board = chess.Board("R5k1/5ppp/8/8/8/8/5PPP/6K1 b - - 1 1")
+    assert _search(board)._terminal_score(board) == MATE_SCORE
+
+    board = chess.Board("r5K1/5PPP/8/8/8/8/5ppp/6k1 w - - 1 1")
+    assert _search(board)._terminal_score(board) == -MATE_SCORE
+
+
+def test_terminal_score_prefers_shorter_mates():
+    board = chess.Board("6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1")
+    search = _search(board)
+    search.history.push(board, chess.Move.from_uci("a1a8"))
+    assert search._terminal_score(board) == MATE_SCORE - 1
+
+
+def test_stalemate_is_draw():
+    board = chess.Board("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+    assert _search(board)._terminal_score(board) == 0
+
+
+def test_mate_in_the_tree_keeps_its_sign():
+    board = chess.Board("6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1")
+    search = _search(board)
+    score = search._minimax(board, 2, float("-inf"), float("inf"), True)
+    assert score == MATE_SCORE - 1
+    assert search.find_best_move(board) == chess.Move.from_uci("a1a8")